@@ -28,13 +28,10 @@ class EmployeeAdmin(admin.ModelAdmin):
     def punch_employees_in(self, request, queryset) -> None:
         results_map = {"success": [], "skipped": []}
         for employee in queryset:
-            if employee.punch_card.punched_in:
+            if employee.punch_card.punch(True):
+                results_map["success"].append(employee.punch_card)
+            else:
                 results_map["skipped"].append(employee.punch_card)
-                continue
-
-            employee.punch_card.punched_in = True
-            employee.punch_card.save()
-            results_map["success"].append(employee.punch_card)
 
         if results_map["skipped"]:
             self.message_user(
@@ -63,13 +60,10 @@ class EmployeeAdmin(admin.ModelAdmin):
     def punch_employees_out(self, request, queryset) -> None:
         results_map = {"success": [], "skipped": []}
         for employee in queryset:
-            if not employee.punch_card.punched_in:
+            if employee.punch_card.punch(False):
+                results_map["success"].append(employee.punch_card)
+            else:
                 results_map["skipped"].append(employee.punch_card)
-                continue
-
-            employee.punch_card.punched_in = False
-            employee.punch_card.save()
-            results_map["success"].append(employee.punch_card)
 
         if results_map["skipped"]:
             self.message_user(
@@ -119,13 +113,10 @@ class EmployeePunchCardAdmin(admin.ModelAdmin):
     def punch_employees_in(self, request, queryset) -> None:
         results_map = {"success": [], "skipped": []}
         for pcard in queryset:
-            if pcard.punched_in:
+            if pcard.punch(True):
+                results_map["success"].append(pcard)
+            else:
                 results_map["skipped"].append(pcard)
-                continue
-
-            pcard.punched_in = True
-            pcard.save()
-            results_map["success"].append(pcard)
 
         if results_map["skipped"]:
             self.message_user(
@@ -154,13 +145,10 @@ class EmployeePunchCardAdmin(admin.ModelAdmin):
     def punch_employees_out(self, request, queryset) -> None:
         results_map = {"success": [], "skipped": []}
         for pcard in queryset:
-            if not pcard.punched_in:
+            if pcard.punch(False):
+                results_map["success"].append(pcard)
+            else:
                 results_map["skipped"].append(pcard)
-                continue
-
-            pcard.punched_in = False
-            pcard.save()
-            results_map["success"].append(pcard)
 
         if results_map["skipped"]:
             self.message_user(
@@ -1,7 +1,7 @@
 import datetime
 
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils import timezone
 
@@ -39,7 +39,7 @@ class Employee(models.Model):
 
     def save(self, **kwargs) -> None:
         """Creates a :py:obj:`~terminusgps_authenticator.models.EmployeePunchCard` for the employee, if it doesn't exist."""
-        if self.pk:
+        if self.pk and not kwargs.get("update_fields"):
             EmployeePunchCard.objects.get_or_create(employee=self)
         super().save(**kwargs)
 
@@ -70,6 +70,11 @@ class EmployeeShift(models.Model):
     class Meta:
         verbose_name = "shift"
         verbose_name_plural = "shifts"
+        indexes = [
+            models.Index(fields=["employee", "-start_datetime"]),
+            models.Index(fields=["employee", "-end_datetime"]),
+            models.Index(fields=["start_datetime", "end_datetime"]),
+        ]
 
     def __str__(self) -> str:
         """Returns ``"<EMPLOYEE_EMAIL> shift #<SHIFT_ID>"``."""
@@ -109,18 +114,66 @@ class EmployeePunchCard(models.Model):
         return f"{self.employee.user.username}'s Punch Card"
 
     def save(self, **kwargs) -> None:
-        """Generates a shift for the employee if the employee is now punched out."""
+        """Punches the employee in or out with :py:meth:`punch` if :py:attr:`punched_in` was changed."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "punched_in" not in update_fields:
+            return super().save(**kwargs)
+
         if self.pk and self._prev_punch_state != self.punched_in:
-            if self._prev_punch_state is True and self.punched_in is False:
+            self.punch(self.punched_in)
+            if update_fields is None:
+                update_fields = [
+                    f.name for f in self._meta.concrete_fields if not f.primary_key
+                ]
+            kwargs["update_fields"] = set(update_fields) - {
+                "punched_in",
+                "last_punch_in_time",
+                "_prev_punch_state",
+            }
+            if not kwargs["update_fields"]:
+                return
+        super().save(**kwargs)
+
+    def punch(self, punched_in: bool) -> bool:
+        """
+        Punches the employee in or out using a single conditional ``UPDATE``.
+
+        A shift is generated for the employee if they were punched out. The shift start time is read from the locked row inside the transaction.
+
+        :param punched_in: Whether to punch the employee in or out.
+        :type punched_in: :py:obj:`bool`
+        :returns: Whether or not the punch state was changed.
+        :rtype: :py:obj:`bool`
+
+        """
+        now = timezone.now()
+        changes = {"punched_in": punched_in, "_prev_punch_state": punched_in}
+        if punched_in:
+            changes["last_punch_in_time"] = now
+
+        with transaction.atomic():
+            punch_cards = EmployeePunchCard.objects.filter(
+                pk=self.pk, punched_in=not punched_in
+            )
+            start_datetime = (
+                punch_cards.select_for_update()
+                .values_list("last_punch_in_time", flat=True)
+                .first()
+            )
+            updated = punch_cards.update(**changes)
+            if updated and not punched_in and start_datetime is not None:
                 EmployeeShift.objects.create(
-                    employee=self.employee,
-                    start_datetime=self.last_punch_in_time,
-                    end_datetime=timezone.now(),
+                    employee_id=self.employee_id,
+                    start_datetime=start_datetime,
+                    end_datetime=now,
                 )
-            else:
-                self.last_punch_in_time = timezone.now()
-            self._prev_punch_state = self.punched_in
-        super().save(**kwargs)
+
+        if not updated:
+            self.refresh_from_db(fields=list(changes))
+            return False
+        for field, value in changes.items():
+            setattr(self, field, value)
+        return True
 
 
 class Report(models.Model):
@@ -144,7 +197,11 @@ class Report(models.Model):
     @cached_property
     def employees(self) -> models.QuerySet[Employee | Employee]:
         """All unique employees present in the report."""
-        return Employee.objects.filter(shifts__in=self.shifts).distinct()
+        return (
+            Employee.objects.filter(pk__in=self.shifts.values("employee_id"))
+            .select_related("user")
+            .defer("code")
+        )
 
     @cached_property
     def shifts(self) -> models.QuerySet[EmployeeShift | EmployeeShift]:
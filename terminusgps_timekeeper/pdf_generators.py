@@ -1,5 +1,6 @@
 import datetime
 import io
+import itertools
 import os
 import pathlib
 
@@ -15,7 +16,7 @@ from reportlab.lib import colors
 from reportlab.lib import pagesizes
 from reportlab.lib import styles
 from reportlab.lib import units
-from terminusgps_timekeeper.models import Employee, Report
+from terminusgps_timekeeper.models import Employee, EmployeeShift, Report
 from terminusgps_timekeeper.utils import display_duration
 
 matplotlib.use("agg")  # Forces matplotlib to run non-interactively
@@ -135,17 +136,17 @@ class PDFReportGenerator:
         :rtype: :py:obj:`dict`
 
         """
+        totals = (
+            self.report.shifts.order_by()
+            .values("employee__user__username")
+            .annotate(total=Sum("duration"))
+        )
         return {
-            str(employee): (
-                self.report.shifts.filter(employee=employee).aggregate(
-                    total=Sum("duration")
-                )["total"]
-                or datetime.timedelta(0)
+            str(row["employee__user__username"]): (
+                row["total"] or datetime.timedelta(0)
             ).total_seconds()
             / 3600
-            for employee in Employee.objects.filter(
-                shifts__in=self.report.shifts
-            ).distinct()
+            for row in totals
         }
 
     def add_spacer(
@@ -361,14 +362,14 @@ class PDFReportGenerator:
         """
         self.add_paragraph("Employee Hours", self.styles["Heading1"])
         self.add_spacer(1, 0.5)
-        if not self.report.shifts.exists():
+        employee_hours = self.get_employee_hours()
+        if not employee_hours:
             self.add_paragraph(
                 "No shifts recorded for this period.", self.styles["Normal"]
             )
             self.add_pagebreak()
             return
 
-        employee_hours = self.get_employee_hours()
         employees = list(employee_hours.keys())
         hours = list(employee_hours.values())
         sorted_data = sorted(zip(employees, hours), key=lambda x: x[1], reverse=True)
@@ -398,19 +399,20 @@ class PDFReportGenerator:
         :rtype: :py:obj:`None`
 
         """
-        if not self.report.shifts.exists():
-            return
-
-        employees = (
-            Employee.objects.filter(shifts__in=self.report.shifts)
-            .distinct()
-            .order_by("user__username")
+        shifts = (
+            self.report.shifts.select_related("employee__user")
+            .defer("employee__code")
+            .order_by("employee__user__username", "end_datetime")
         )
-        for employee in employees:
-            employee_shifts = self.report.shifts.filter(employee=employee)
+        shift_groups = [
+            list(group)
+            for _, group in itertools.groupby(shifts, key=lambda s: s.employee_id)
+        ]
+        for i, employee_shifts in enumerate(shift_groups):
+            employee = employee_shifts[0].employee
             self.add_paragraph(f"Shift Report: {employee}", self.styles["Heading2"])
             self.add_spacer(1, 0.25)
-            self._add_employee_weekly_pattern_chart(employee)
+            self._add_employee_weekly_pattern_chart(employee, employee_shifts)
             self.add_spacer(1, 0.25)
             data = [["Start Date/Time", "End Date/Time", "Duration"]]
             total_duration = datetime.timedelta(0)
@@ -426,21 +428,24 @@ class PDFReportGenerator:
             self.add_table(data)
             self.add_spacer(1, 0.5)
 
-            if employee != employees.last():
+            if i < len(shift_groups) - 1:
                 self.add_pagebreak()
 
-    def _add_employee_weekly_pattern_chart(self, employee: Employee) -> None:
+    def _add_employee_weekly_pattern_chart(
+        self, employee: Employee, shifts: list[EmployeeShift]
+    ) -> None:
         """
         Adds an employee weekly shift pattern chart to the document.
 
         :param employee: An employee.
         :type employee: :py:obj:`~terminusgps_timekeeper.models.Employee`
+        :param shifts: The employee's shifts within the report period.
+        :type shifts: :py:obj:`list`
         :returns: Nothing.
         :rtype: :py:obj:`None`
 
         """
-        shifts = self.report.shifts.filter(employee=employee)
-        if not shifts.exists():
+        if not shifts:
             self.add_paragraph(
                 f"No shift data available for {employee} in this period.",
                 self.styles["Normal"],
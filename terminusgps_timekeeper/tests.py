@@ -1,3 +1,51 @@
+import io
+
+import openpyxl
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.urls import reverse
+from openpyxl.styles import Font
+
+from terminusgps_timekeeper.models import Employee
+
+
+class EmployeeBatchCreateViewTestCase(TestCase):
+    def test_xlsx_with_formatted_trailing_column(self) -> None:
+        """Empty header cells inside the sheet dimensions are ignored."""
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["Email", "Phone", "Title"])
+        sheet.append(["employee@terminusgps.com", "+15555555555", "L1 Engineer"])
+        sheet["E1"].font = Font(bold=True)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        response = self.client.post(
+            reverse("create employee batch"),
+            {"input_file": SimpleUploadedFile("employees.xlsx", buffer.getvalue())},
+        )
+
+        self.assertRedirects(
+            response, reverse("list employees"), fetch_redirect_response=False
+        )
+        employee = Employee.objects.get(user__username="employee@terminusgps.com")
+        self.assertEqual(employee.phone, "+15555555555")
+        self.assertEqual(employee.title, "L1 Engineer")
+
+    def test_email_taken_by_existing_user_email(self) -> None:
+        """Rows reusing an existing user's email address are rejected."""
+        get_user_model().objects.create_user(
+            username="someone", email="Employee@terminusgps.com"
+        )
+        input_file = SimpleUploadedFile(
+            "employees.csv", b"Email,Phone,Title\nemployee@terminusgps.com,,\n"
+        )
+
+        response = self.client.post(
+            reverse("create employee batch"), {"input_file": input_file}
+        )
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Emails already taken")
+        self.assertFalse(Employee.objects.exists())
@@ -1,19 +1,30 @@
-import pandas as pd
+import csv
+import io
+import zipfile
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import openpyxl
+from openpyxl.utils.exceptions import InvalidFileException
+
 from django import forms
 from django.contrib.auth import get_user_model
-from django.contrib.auth.base_user import AbstractBaseUser
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
 from django.core.files import File
+from django.core.validators import validate_email
+from django.db import transaction
 from django.db.models import Q, QuerySet
+from django.db.models.functions import Lower
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView, FormView, ListView, UpdateView
 
-from terminusgps_timekeeper.models import Employee, EmployeeShift
+from terminusgps_timekeeper.models import Employee, EmployeePunchCard, EmployeeShift
 from terminusgps_timekeeper.utils import generate_random_password
 from terminusgps_timekeeper.views.mixins import HtmxTemplateResponseMixin
 from terminusgps_timekeeper.forms import (
@@ -36,7 +47,7 @@ class EmployeeCreateView(HtmxTemplateResponseMixin, FormView):
         username: str = form.cleaned_data["email"]
         password: str = generate_random_password()
 
-        employee = Employee.objects.create(
+        Employee.objects.create(
             user=get_user_model().objects.create_user(
                 username=username, password=password
             ),
@@ -45,7 +56,6 @@ class EmployeeCreateView(HtmxTemplateResponseMixin, FormView):
             pfp=form.cleaned_data["pfp"],
             title=form.cleaned_data["title"],
         )
-        employee.save()
         return HttpResponseRedirect(self.get_success_url())
 
 
@@ -62,7 +72,12 @@ class EmployeeListView(LoginRequiredMixin, HtmxTemplateResponseMixin, ListView):
     raise_exception = False
 
     def get_queryset(self, **kwargs) -> QuerySet:
-        queryset = super().get_queryset(**kwargs)
+        queryset = (
+            super()
+            .get_queryset(**kwargs)
+            .select_related("user", "punch_card")
+            .defer("code")
+        )
         form = EmployeeSearchForm({"q": self.request.GET.get("q")})
         if form.is_valid() and form.cleaned_data["q"] is not None:
             query = form.cleaned_data["q"]
@@ -87,8 +102,9 @@ class EmployeeBatchCreateView(HtmxTemplateResponseMixin, FormView):
 
     def form_valid(self, form: EmployeeBatchCreateForm) -> HttpResponse:
         try:
-            df = self.get_dataframe(form.cleaned_data["input_file"])
-        except ValueError as e:
+            rows = list(self.get_rows(form.cleaned_data["input_file"]))
+            self.validate_emails_unique(rows)
+        except (ValueError, csv.Error, zipfile.BadZipFile, InvalidFileException) as e:
             form.add_error(
                 "input_file",
                 ValidationError(
@@ -97,7 +113,7 @@ class EmployeeBatchCreateView(HtmxTemplateResponseMixin, FormView):
             )
             return self.form_invalid(form=form)
 
-        if df is None:
+        if not rows:
             form.add_error(
                 "input_file",
                 ValidationError(
@@ -108,43 +124,136 @@ class EmployeeBatchCreateView(HtmxTemplateResponseMixin, FormView):
             )
             return self.form_invalid(form=form)
 
-        for i, row in df.iterrows():
-            email: str = str(row["Email"])
-            phone: str | None = str(row["Phone"]) if pd.notna(row["Phone"]) else None
-            title: str | None = str(row["Title"]) if pd.notna(row["Title"]) else None
-            user: AbstractBaseUser = get_user_model().objects.create_user(
-                username=email, password=generate_random_password()
-            )
-            Employee.objects.create(user=user, phone=phone, title=title)
+        self.create_employees(rows)
         return super().form_valid(form=form)
 
-    def get_dataframe(self, input_file: File) -> pd.DataFrame | None:
+    def create_employees(
+        self, rows: list[dict[str, str | None]], batch_size: int = 1000
+    ) -> None:
+        """Creates a user, employee and punch card for each row using bulk inserts."""
+        User = get_user_model()
+        with ThreadPoolExecutor() as executor:
+            passwords = list(
+                executor.map(make_password, (generate_random_password() for _ in rows))
+            )
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                [
+                    User(
+                        username=User.normalize_username(row["Email"]),
+                        password=password,
+                    )
+                    for row, password in zip(rows, passwords)
+                ],
+                batch_size=batch_size,
+            )
+            employees = Employee.objects.bulk_create(
+                [
+                    Employee(user=user, phone=row.get("Phone"), title=row.get("Title"))
+                    for user, row in zip(users, rows)
+                ],
+                batch_size=batch_size,
+            )
+            EmployeePunchCard.objects.bulk_create(
+                [EmployeePunchCard(employee=employee) for employee in employees],
+                batch_size=batch_size,
+            )
+
+    def get_rows(self, input_file: File) -> Iterator[dict[str, str | None]]:
+        """Yields each non-empty row of the input file as a dictionary keyed by column name."""
+        reader = self.read_spreadsheet(input_file)
+        header = [self.clean_cell(col) for col in next(reader, ())]
+        columns = {i: col for i, col in enumerate(header) if col is not None}
+        self.validate_header(tuple(columns.values()))
+        for line, values in enumerate(reader, start=2):
+            row = {
+                col: self.clean_cell(values[i]) if i < len(values) else None
+                for i, col in columns.items()
+            }
+            if any(row.values()):
+                self.validate_row_email(row.get("Email"), line)
+                yield row
+
+    @staticmethod
+    def validate_row_email(email: str | None, line: int) -> None:
+        """Raises :py:exec:`ValueError` if the row's email is missing or invalid."""
+        if email is None:
+            raise ValueError(f"Row {line} is missing an email.")
+        try:
+            validate_email(email)
+        except ValidationError:
+            raise ValueError(f"Row {line} has an invalid email: '{email}'.")
+
+    @staticmethod
+    def validate_emails_unique(rows: list[dict[str, str | None]]) -> None:
+        """Raises :py:exec:`ValueError` if any email is repeated in the rows or already taken."""
+        emails: list[str] = [str(row["Email"]).lower() for row in rows]
+        duplicates: list[str] = [e for e, n in Counter(emails).items() if n > 1]
+        if duplicates:
+            raise ValueError(f"Duplicate emails: '{sorted(duplicates)}'")
+
+        unique_emails: set[str] = set(emails)
+        filters: Q = Q(lower_username__in=emails) | Q(lower_email__in=emails)
+        users = (
+            get_user_model()
+            .objects.annotate(
+                lower_username=Lower("username"), lower_email=Lower("email")
+            )
+            .filter(filters)
+            .values_list("lower_username", "lower_email")
+        )
+        taken: set[str] = {e for user in users for e in user if e in unique_emails}
+        if taken:
+            raise ValueError(f"Emails already taken: '{sorted(taken)}'")
+
+    @staticmethod
+    def clean_cell(value: Any) -> str | None:
+        """Returns the cell value as a stripped string, or :py:obj:`None` if it was empty."""
+        if value is None:
+            return None
+        return str(value).strip() or None
+
+    @staticmethod
+    def read_spreadsheet(input_file: File) -> Iterator[tuple[Any, ...]]:
+        """Streams the rows of a csv or xlsx file without loading the whole file into memory."""
         ext = "".join(input_file.name.split(".")[-1])
 
         match ext:
             case "csv":
-                df = pd.read_csv(input_file)
+                yield from csv.reader(
+                    io.TextIOWrapper(input_file, encoding="utf-8-sig", newline="")
+                )
             case "xlsx":
-                df = pd.read_excel(input_file)
+                try:
+                    workbook = openpyxl.load_workbook(
+                        input_file, read_only=True, data_only=True
+                    )
+                except KeyError:
+                    raise ValueError(f"'{input_file.name}' is not a valid xlsx file.")
+                try:
+                    yield from workbook.active.iter_rows(values_only=True)
+                finally:
+                    workbook.close()
             case _:
                 raise ValueError(f"Invalid input file type: '{ext}'.")
-        return self.validate_dataframe(df)
 
-    def validate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame | None:
-        """Raises :py:exec:`~django.core.exceptions.ValidationError` if any invalid columns are present in the :py:obj:`~pandas.DataFrame`."""
+    def validate_header(self, header: tuple[Any, ...]) -> tuple[str, ...]:
+        """Raises :py:exec:`ValueError` if any invalid columns are present in the non-empty header cells, or if the ``Email`` column is missing."""
         target_cols: tuple[str, str, str] = ("Email", "Phone", "Title")
-        bad_cols: list[str] = [col for col in df.columns if col not in target_cols]
+        bad_cols: list[str] = [col for col in header if col not in target_cols]
 
         if bad_cols:
             raise ValueError(f"Invalid column names: '{bad_cols}'")
-        return df
+        if "Email" not in header:
+            raise ValueError("Missing required column: 'Email'")
+        return tuple(header)
 
 
 class EmployeeDetailView(HtmxTemplateResponseMixin, DetailView):
     model = Employee
     template_name = "terminusgps_timekeeper/employees/detail.html"
     partial_template_name = "terminusgps_timekeeper/employees/partials/_detail.html"
-    queryset = Employee.objects.all()
+    queryset = Employee.objects.select_related("user", "punch_card").defer("code")
     context_object_name = "employee"
     http_method_names = ["get", "patch"]
     extra_context = {"class": "flex flex-col gap-8", "title": "Employee Details"}
@@ -159,7 +268,7 @@ class EmployeeDetailView(HtmxTemplateResponseMixin, DetailView):
         return status_map.get(status, None)
 
     def get_shifts(self, total: int = 5) -> QuerySet[EmployeeShift | EmployeeShift]:
-        e, o = self.get_object(), "-start_datetime"
+        e, o = self.object, "-start_datetime"
         return EmployeeShift.objects.filter(employee=e).order_by(o)[:total]
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
@@ -173,9 +282,7 @@ class EmployeeDetailView(HtmxTemplateResponseMixin, DetailView):
 
         status = self.clean_status(request.GET.get("status"))
         if status is not None:
-            employee = self.get_object()
-            employee.punch_card.punched_in = status
-            employee.punch_card.save()
+            self.get_object().punch_card.punch(status)
         return self.get(request, *args, **kwargs)
 
 